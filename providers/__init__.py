@@ -1,15 +1,36 @@
 """Model provider abstractions for supporting multiple AI providers."""
 
+import importlib
+
 from .base import ModelCapabilities, ModelProvider, ModelResponse, ProviderType
-from .custom import CustomProvider
-from .dial import DIALModelProvider
-from .gemini import GeminiModelProvider
-from .openai_compatible import OpenAICompatibleProvider
-from .openai_provider import OpenAIModelProvider
-from .openrouter import OpenRouterProvider
 from .registry import ModelProviderRegistry
-from .unified_openai import UnifiedOpenAIProvider
-from .xai import XAIModelProvider
+
+# Concrete providers pull in their SDKs (openai, google-genai, httpx) at import time,
+# so they are only imported when first accessed (PEP 562).
+_LAZY_PROVIDERS = {
+    "CustomProvider": ".custom",
+    "DIALModelProvider": ".dial",
+    "GeminiModelProvider": ".gemini",
+    "OpenAICompatibleProvider": ".openai_compatible",
+    "OpenAIModelProvider": ".openai_provider",
+    "OpenRouterProvider": ".openrouter",
+    "UnifiedOpenAIProvider": ".unified_openai",
+    "XAIModelProvider": ".xai",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PROVIDERS))
+
 
 __all__ = [
     "ModelProvider",
@@ -93,25 +93,25 @@ class CustomProvider(OpenAICompatibleProvider):
 
         if config:
             if config.model_name != model_name:
-                logging.info(f"Resolved model alias '{model_name}' to '{config.model_name}'")
+                logging.info("Resolved model alias '%s' to '%s'", model_name, config.model_name)
             return config.model_name
         else:
             # If not found in registry, handle version tags for local models
             # Strip version tags (anything after ':') for Ollama-style models
             if ":" in model_name:
                 base_model = model_name.split(":")[0]
-                logging.debug(f"Stripped version tag from '{model_name}' -> '{base_model}'")
+                logging.debug("Stripped version tag from '%s' -> '%s'", model_name, base_model)
 
                 # Try to resolve the base model through registry
                 base_config = self._registry.resolve(base_model)
                 if base_config:
-                    logging.info(f"Resolved base model '{base_model}' to '{base_config.model_name}'")
+                    logging.info("Resolved base model '%s' to '%s'", base_model, base_config.model_name)
                     return base_config.model_name
                 else:
                     return base_model
             else:
                 # If not found in registry and no version tag, return as-is
-                logging.debug(f"Model '{model_name}' not found in registry, using as-is")
+                logging.debug("Model '%s' not found in registry, using as-is", model_name)
                 return model_name
 
     def get_capabilities(self, model_name: str) -> ModelCapabilities:
@@ -148,8 +148,9 @@ class CustomProvider(OpenAICompatibleProvider):
             resolved_name = self._resolve_model_name(model_name)
 
             logging.debug(
-                f"Using generic capabilities for '{resolved_name}' via Custom API. "
-                "Consider adding to custom_models.json for specific capabilities."
+                "Using generic capabilities for '%s' via Custom API. "
+                "Consider adding to custom_models.json for specific capabilities.",
+                resolved_name,
             )
 
             # Create generic capabilities with conservative defaults
@@ -196,7 +197,7 @@ class CustomProvider(OpenAICompatibleProvider):
             model_id = config.model_name
             # Use explicit is_custom flag for clean validation
             if config.is_custom:
-                logging.debug(f"... [Custom] Model '{model_name}' -> '{model_id}' validated via registry")
+                logging.debug("... [Custom] Model '%s' -> '%s' validated via registry", model_name, model_id)
                 return True
             else:
                 # This is a cloud/OpenRouter model - CustomProvider should NOT handle these
@@ -208,7 +209,7 @@ class CustomProvider(OpenAICompatibleProvider):
         clean_model_name = model_name
         if ":" in model_name:
             clean_model_name = model_name.split(":")[0]
-            logging.debug(f"Stripped version tag from '{model_name}' -> '{clean_model_name}'")
+            logging.debug("Stripped version tag from '%s' -> '%s'", model_name, clean_model_name)
             # Try to resolve the clean name
             config = self._registry.resolve(clean_model_name)
             if config:
@@ -219,16 +220,16 @@ class CustomProvider(OpenAICompatibleProvider):
 
         # Accept models with explicit local indicators in the name
         if any(indicator in clean_model_name.lower() for indicator in ["local", "ollama", "vllm", "lmstudio"]):
-            logging.debug(f"Model '{clean_model_name}' validated via local indicators")
+            logging.debug("Model '%s' validated via local indicators", clean_model_name)
             return True
 
         # Accept simple model names without vendor prefix (likely local/custom models)
         if "/" not in clean_model_name:
-            logging.debug(f"Model '{clean_model_name}' validated as potential local model (no vendor prefix)")
+            logging.debug("Model '%s' validated as potential local model (no vendor prefix)", clean_model_name)
             return True
 
         # Reject everything else (likely cloud models not in registry)
-        logging.debug(f"Model '{model_name}' rejected by custom provider (appears to be cloud model)")
+        logging.debug("Model '%s' rejected by custom provider (appears to be cloud model)", model_name)
         return False
 
     def generate_content(
@@ -4,6 +4,7 @@ import base64
 import ipaddress
 import logging
 import os
+import threading
 import time
 from abc import abstractmethod
 from typing import Optional
@@ -41,6 +42,7 @@ class OpenAICompatibleProvider(ModelProvider):
         """
         super().__init__(api_key, **kwargs)
         self._client = None
+        self._client_init_lock = threading.Lock()
         self.base_url = base_url
         self.organization = kwargs.get("organization")
         self.allowed_models = self._parse_allowed_models()
@@ -66,8 +68,8 @@ class OpenAICompatibleProvider(ModelProvider):
             Set of allowed model names (lowercase) or None if not configured
         """
         # Get provider-specific allowed models
-        provider_type = self.get_provider_type().value.upper()
-        env_var = f"{provider_type}_ALLOWED_MODELS"
+        provider_type = self.get_provider_type()
+        env_var = f"{provider_type.value.upper()}_ALLOWED_MODELS"
         models_str = os.getenv(env_var, "")
 
         if models_str:
@@ -78,7 +80,7 @@ class OpenAICompatibleProvider(ModelProvider):
                 return models
 
         # Log info if no allow-list configured for proxy providers
-        if self.get_provider_type() not in [ProviderType.GOOGLE, ProviderType.OPENAI]:
+        if provider_type not in [ProviderType.GOOGLE, ProviderType.OPENAI]:
             logging.info(
                 f"Model allow-list not configured for {self.FRIENDLY_NAME} - all models permitted. "
                 f"To restrict access, set {env_var} with comma-separated model names."
@@ -197,72 +199,75 @@ class OpenAICompatibleProvider(ModelProvider):
     def client(self):
         """Lazy initialization of OpenAI client with security checks and timeout configuration."""
         if self._client is None:
-            import os
+            with self._client_init_lock:
+                # Double-check pattern: another thread may have created the client while we waited
+                if self._client is None:
+                    self._client = self._create_client()
 
-            import httpx
+        return self._client
 
-            # Temporarily disable proxy environment variables to prevent httpx from detecting them
-            original_env = {}
-            proxy_env_vars = ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"]
+    def _create_client(self):
+        """Create the OpenAI client, isolating it from proxy environment variables."""
+        import httpx
 
-            for var in proxy_env_vars:
-                if var in os.environ:
-                    original_env[var] = os.environ[var]
-                    del os.environ[var]
+        # Temporarily disable proxy environment variables to prevent httpx from detecting them
+        original_env = {}
+        proxy_env_vars = ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"]
 
-            try:
-                # Create a custom httpx client that explicitly avoids proxy parameters
-                timeout_config = (
-                    self.timeout_config
-                    if hasattr(self, "timeout_config") and self.timeout_config
-                    else httpx.Timeout(30.0)
-                )
+        for var in proxy_env_vars:
+            if var in os.environ:
+                original_env[var] = os.environ[var]
+                del os.environ[var]
 
-                # Create httpx client with minimal config to avoid proxy conflicts
-                # Note: proxies parameter was removed in httpx 0.28.0
-                http_client = httpx.Client(
-                    timeout=timeout_config,
-                    follow_redirects=True,
-                )
+        try:
+            # Create a custom httpx client that explicitly avoids proxy parameters
+            timeout_config = (
+                self.timeout_config if hasattr(self, "timeout_config") and self.timeout_config else httpx.Timeout(30.0)
+            )
 
-                # Keep client initialization minimal to avoid proxy parameter conflicts
-                client_kwargs = {
-                    "api_key": self.api_key,
-                    "http_client": http_client,
-                }
+            # Create httpx client with minimal config to avoid proxy conflicts
+            # Note: proxies parameter was removed in httpx 0.28.0
+            http_client = httpx.Client(
+                timeout=timeout_config,
+                follow_redirects=True,
+            )
 
-                if self.base_url:
-                    client_kwargs["base_url"] = self.base_url
+            # Keep client initialization minimal to avoid proxy parameter conflicts
+            client_kwargs = {
+                "api_key": self.api_key,
+                "http_client": http_client,
+            }
 
-                if self.organization:
-                    client_kwargs["organization"] = self.organization
+            if self.base_url:
+                client_kwargs["base_url"] = self.base_url
 
-                # Add default headers if any
-                if self.DEFAULT_HEADERS:
-                    client_kwargs["default_headers"] = self.DEFAULT_HEADERS.copy()
+            if self.organization:
+                client_kwargs["organization"] = self.organization
 
-                logging.debug(f"OpenAI client initialized with custom httpx client and timeout: {timeout_config}")
+            # Add default headers if any
+            if self.DEFAULT_HEADERS:
+                client_kwargs["default_headers"] = self.DEFAULT_HEADERS.copy()
 
-                # Create OpenAI client with custom httpx client
-                self._client = OpenAI(**client_kwargs)
+            logging.debug(f"OpenAI client initialized with custom httpx client and timeout: {timeout_config}")
 
-            except Exception as e:
-                # If all else fails, try absolute minimal client without custom httpx
-                logging.warning(f"Failed to create client with custom httpx, falling back to minimal config: {e}")
-                try:
-                    minimal_kwargs = {"api_key": self.api_key}
-                    if self.base_url:
-                        minimal_kwargs["base_url"] = self.base_url
-                    self._client = OpenAI(**minimal_kwargs)
-                except Exception as fallback_error:
-                    logging.error(f"Even minimal OpenAI client creation failed: {fallback_error}")
-                    raise
-            finally:
-                # Restore original proxy environment variables
-                for var, value in original_env.items():
-                    os.environ[var] = value
+            # Create OpenAI client with custom httpx client
+            return OpenAI(**client_kwargs)
 
-        return self._client
+        except Exception as e:
+            # If all else fails, try absolute minimal client without custom httpx
+            logging.warning(f"Failed to create client with custom httpx, falling back to minimal config: {e}")
+            try:
+                minimal_kwargs = {"api_key": self.api_key}
+                if self.base_url:
+                    minimal_kwargs["base_url"] = self.base_url
+                return OpenAI(**minimal_kwargs)
+            except Exception as fallback_error:
+                logging.error(f"Even minimal OpenAI client creation failed: {fallback_error}")
+                raise
+        finally:
+            # Restore original proxy environment variables
+            for var, value in original_env.items():
+                os.environ[var] = value
 
     def _generate_with_responses_endpoint(
         self,
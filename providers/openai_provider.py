@@ -13,6 +13,10 @@ from .openai_compatible import OpenAICompatibleProvider
 
 logger = logging.getLogger(__name__)
 
+# Temperature constraints are stateless, so models share one instance per constraint type
+_FIXED_TEMPERATURE = create_temperature_constraint("fixed")
+_RANGE_TEMPERATURE = create_temperature_constraint("range")
+
 
 class OpenAIModelProvider(OpenAICompatibleProvider):
     """Official OpenAI API provider (api.openai.com)."""
@@ -33,7 +37,7 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
             supports_images=True,  # O3 models support vision
             max_image_size_mb=20.0,  # 20MB per OpenAI docs
             supports_temperature=False,  # O3 models don't accept temperature parameter
-            temperature_constraint=create_temperature_constraint("fixed"),
+            temperature_constraint=_FIXED_TEMPERATURE,
             description="Strong reasoning (200K context) - Logical problems, code generation, systematic analysis",
             aliases=[],
         ),
@@ -51,9 +55,9 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
             supports_images=True,  # O3 models support vision
             max_image_size_mb=20.0,  # 20MB per OpenAI docs
             supports_temperature=False,  # O3 models don't accept temperature parameter
-            temperature_constraint=create_temperature_constraint("fixed"),
+            temperature_constraint=_FIXED_TEMPERATURE,
             description="Fast O3 variant (200K context) - Balanced performance/speed, moderate complexity",
-            aliases=["o3mini", "o3-mini"],
+            aliases=["o3mini"],
         ),
         "o3-pro-2025-06-10": ModelCapabilities(
             provider=ProviderType.OPENAI,
@@ -69,7 +73,7 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
             supports_images=True,  # O3 models support vision
             max_image_size_mb=20.0,  # 20MB per OpenAI docs
             supports_temperature=False,  # O3 models don't accept temperature parameter
-            temperature_constraint=create_temperature_constraint("fixed"),
+            temperature_constraint=_FIXED_TEMPERATURE,
             description="Professional-grade reasoning (200K context) - EXTREMELY EXPENSIVE: Only for the most complex problems requiring universe-scale complexity analysis OR when the user explicitly asks for this model. Use sparingly for critical architectural decisions or exceptionally complex debugging that other models cannot handle.",
             aliases=["o3-pro"],
         ),
@@ -87,9 +91,9 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
             supports_images=True,  # O4 models support vision
             max_image_size_mb=20.0,  # 20MB per OpenAI docs
             supports_temperature=False,  # O4 models don't accept temperature parameter
-            temperature_constraint=create_temperature_constraint("fixed"),
+            temperature_constraint=_FIXED_TEMPERATURE,
             description="Latest reasoning model (200K context) - Optimized for shorter contexts, rapid reasoning",
-            aliases=["mini", "o4mini", "o4-mini"],
+            aliases=["mini", "o4mini"],
         ),
         "gpt-4.1-2025-04-14": ModelCapabilities(
             provider=ProviderType.OPENAI,
@@ -105,12 +109,19 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
             supports_images=True,  # GPT-4.1 supports vision
             max_image_size_mb=20.0,  # 20MB per OpenAI docs
             supports_temperature=True,  # Regular models accept temperature parameter
-            temperature_constraint=create_temperature_constraint("range"),
+            temperature_constraint=_RANGE_TEMPERATURE,
             description="GPT-4.1 (1M context) - Advanced reasoning model with large context window",
             aliases=["gpt4.1"],
         ),
     }
 
+    # Case-folded model names and aliases mapped to their canonical name so resolution is
+    # a single dict lookup; canonical names take precedence over any clashing alias
+    _ALIAS_MAP = {
+        **{alias.casefold(): name for name, capabilities in SUPPORTED_MODELS.items() for alias in capabilities.aliases},
+        **{name.casefold(): name for name in SUPPORTED_MODELS},
+    }
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize OpenAI provider with API key."""
         # Set default OpenAI base URL, allow override for regions/custom endpoints
@@ -135,6 +146,10 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
         # Return the ModelCapabilities object directly from SUPPORTED_MODELS
         return self.SUPPORTED_MODELS[resolved_name]
 
+    def _resolve_model_name(self, model_name: str) -> str:
+        """Resolve model shorthand to full name using the precomputed alias map."""
+        return self._ALIAS_MAP.get(model_name.casefold(), model_name)
+
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
         return ProviderType.OPENAI
@@ -108,7 +108,7 @@ class ModelProviderRegistry:
         Returns:
             ModelProvider instance that supports this model
         """
-        logging.debug(f"get_provider_for_model called with model_name='{model_name}'")
+        logging.debug("get_provider_for_model called with model_name='%s'", model_name)
 
         # Define explicit provider priority order
         # Native APIs first, then custom endpoints, then catch-all providers
@@ -124,23 +124,24 @@ class ModelProviderRegistry:
 
         # Check providers in priority order
         instance = cls()
-        logging.debug(f"Registry instance: {instance}")
-        logging.debug(f"Available providers in registry: {list(instance._providers.keys())}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Registry instance: %s", instance)
+            logging.debug("Available providers in registry: %s", list(instance._providers.keys()))
 
         for provider_type in PROVIDER_PRIORITY_ORDER:
             if provider_type in instance._providers:
-                logging.debug(f"Found {provider_type} in registry")
+                logging.debug("Found %s in registry", provider_type)
                 # Get or create provider instance
                 provider = cls.get_provider(provider_type)
                 if provider and provider.validate_model_name(model_name):
-                    logging.debug(f"{provider_type} validates model {model_name}")
+                    logging.debug("%s validates model %s", provider_type, model_name)
                     return provider
                 else:
-                    logging.debug(f"{provider_type} does not validate model {model_name}")
+                    logging.debug("%s does not validate model %s", provider_type, model_name)
             else:
-                logging.debug(f"{provider_type} not found in registry")
+                logging.debug("%s not found in registry", provider_type)
 
-        logging.debug(f"No provider found for model {model_name}")
+        logging.debug("No provider found for model %s", model_name)
         return None
 
     @classmethod
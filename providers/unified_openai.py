@@ -1,89 +1,236 @@
 """Unified OpenAI-compatible provider that can route to any model with custom endpoints."""
 
+import functools
+import json
 import logging
 import os
-from typing import Optional, Dict, Any
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
-from .base import ModelProvider, ModelResponse, ProviderType, ModelCapabilities
+from .base import ModelCapabilities, ModelProvider, ModelResponse, ProviderType
+from .custom import CustomProvider
+from .openai_compatible import OpenAICompatibleProvider
 from .registry import ModelProviderRegistry
 
 logger = logging.getLogger(__name__)
 
+# Seconds a model nothing could resolve stays cached, so repeated lookups of unknown models
+# skip the registry walk while providers registered later are still picked up
+_MISS_TTL = 60.0
+
+# Maximum number of model names remembered per unified provider instance
+_PROVIDER_CACHE_SIZE = 1024
+
+# Runs of anything other than letters and digits, stripped from model names in one C-level pass
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_endpoint_key(model_name: str) -> str:
+    """Reduce a model name to its endpoint lookup key.
+
+    Only lower-cased letters and digits are kept, so lookups ignore case and separators
+    and LLAMA3_2_ENDPOINT serves "llama3.2" as well as "llama3-2". The same handful of
+    model names is looked up on every request, so results are memoized.
+    """
+    return sys.intern(_NON_ALNUM.sub("", model_name.lower()))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_config(path: str, mtime_ns: int) -> dict:
+    """Parse a JSON config file.
+
+    Cached per modification time, so reloading an unchanged file skips the read and parse
+    while an edited file is parsed again. Callers must treat the result as read-only.
+    """
+    return json.loads(Path(path).read_bytes())
+
 
 class UnifiedOpenAIProvider(ModelProvider):
     """
     Unified OpenAI-compatible provider that can route requests to any model
     with customizable endpoints while maintaining OpenAI API compatibility.
     """
-    
+
     FRIENDLY_NAME = "Unified OpenAI"
-    
+
+    # Endpoint providers shared by all instances, keyed by (base_url, api_key), so models
+    # routed to the same endpoint reuse one OpenAI client and its connection pool
+    _endpoint_providers: dict[tuple[str, str], ModelProvider] = {}
+    _endpoint_providers_lock = threading.Lock()
+
+    # Endpoint configuration snapshot shared by all instances, loaded on first use (see _endpoints)
+    _model_endpoints: Optional[Mapping[str, Mapping[str, str]]] = None
+    _endpoints_lock = threading.Lock()
+    # Bumped by reload_endpoints so every instance drops the providers it resolved before
+    _endpoints_generation = 0
+
     def __init__(self, api_key: str = "", **kwargs):
         """Initialize the unified provider."""
         super().__init__(api_key=api_key)
-        self._model_endpoints = self._load_model_endpoints()
-        self._provider_cache = {}
-    
-    def _load_model_endpoints(self) -> Dict[str, Dict[str, str]]:
+        # model name -> (provider or None, expiry for misses or None), least recently used first
+        self._provider_cache = OrderedDict()
+        self._provider_cache_lock = threading.Lock()
+        self._cache_generation = self._endpoints_generation
+
+    @classmethod
+    def _endpoints(cls) -> Mapping[str, Mapping[str, str]]:
+        """Get the custom endpoint configuration, loading it on first access."""
+        if cls._model_endpoints is None:
+            with cls._endpoints_lock:
+                # Double-check pattern: another thread may have loaded it while we waited
+                if cls._model_endpoints is None:
+                    cls._model_endpoints = cls._load_model_endpoints()
+
+        return cls._model_endpoints
+
+    @classmethod
+    def reload_endpoints(cls) -> None:
+        """Discard the shared endpoint configuration so it is re-read on next use.
+
+        Every instance also discards the providers it resolved, including cached misses.
+        """
+        with cls._endpoints_lock:
+            cls._model_endpoints = None
+            cls._endpoints_generation += 1
+
+    @classmethod
+    def _load_model_endpoints(cls) -> Mapping[str, Mapping[str, str]]:
         """Load custom endpoints configuration for models."""
+        # Single pass over the environment collecting <MODEL>_ENDPOINT variables. Iterating keys
+        # and indexing only the matches avoids decoding the value of every unrelated variable;
+        # the matching <MODEL>_API_KEY is then fetched directly for each endpoint found.
+        env = os.environ
+        endpoint_urls = {key[:-9]: env[key] for key in env if key.endswith("_ENDPOINT")}
+
         endpoints = {}
-        
-        for key, value in os.environ.items():
-            if key.endswith('_ENDPOINT'):
-                model_name = key[:-9].lower().replace('_', '-')
-                endpoints[model_name] = {
-                    'base_url': value,
-                    'api_key': os.getenv(f"{key[:-9]}_API_KEY", "")
-                }
-        
-        config_path = os.getenv("UNIFIED_ENDPOINTS_CONFIG")
+        # Configured name behind each normalized key, so names that collide can be reported
+        configured_names = {}
+
+        def add_endpoint(name: str, base_url: str, api_key: str) -> None:
+            key = cls._normalize_model_name(name)
+            if key in configured_names:
+                logger.warning(
+                    "Unified endpoint '%s' replaces '%s': names are matched ignoring case and separators",
+                    name,
+                    configured_names[key],
+                )
+            configured_names[key] = name
+            endpoints[key] = {"base_url": base_url, "api_key": api_key}
+
+        for prefix, url in endpoint_urls.items():
+            add_endpoint(prefix, url, env.get(f"{prefix}_API_KEY", ""))
+
+        config_path = env.get("UNIFIED_ENDPOINTS_CONFIG")
         if config_path:
             try:
-                import json
-                with open(config_path, 'r') as f:
-                    file_config = json.load(f)
-                    endpoints.update(file_config.get('model_endpoints', {}))
+                file_config = _load_json_config(config_path, os.stat(config_path).st_mtime_ns)
+
+                # Keys are stored normalized so lookups are a single probe, and entries get the
+                # same {"base_url", "api_key"} shape as environment endpoints
+                for name, config in file_config.get("model_endpoints", {}).items():
+                    if not isinstance(config, dict) or not config.get("base_url"):
+                        logger.warning("Skipping unified endpoint '%s' without base_url", name)
+                        continue
+                    add_endpoint(name, config["base_url"], config.get("api_key", ""))
             except Exception as e:
-                logger.warning(f"Failed to load unified endpoints config: {e}")
-        
-        return endpoints
-    
-    def _get_endpoint_for_model(self, model_name: str) -> Optional[Dict[str, str]]:
+                logger.warning("Failed to load unified endpoints config: %s", e)
+
+        # The table and its entries are shared by every instance, so both are exposed read-only.
+        # Keys come from _normalize_endpoint_key and are already interned, so lookups match on identity.
+        return MappingProxyType({name: MappingProxyType(config) for name, config in endpoints.items()})
+
+    @staticmethod
+    def _normalize_model_name(model_name: str) -> str:
+        """Reduce a model name to its endpoint lookup key (see _normalize_endpoint_key)."""
+        return _normalize_endpoint_key(model_name)
+
+    def _get_endpoint_for_model(self, model_name: str) -> Optional[Mapping[str, str]]:
         """Get custom endpoint configuration for a model."""
-        if model_name in self._model_endpoints:
-            return self._model_endpoints[model_name]
-        
-        model_lower = model_name.lower()
-        for configured_model, config in self._model_endpoints.items():
-            if configured_model.lower() == model_lower:
-                return config
-        
-        return None
-    
+        endpoints = self._endpoints()
+        # Common case: no custom endpoints configured, skip normalizing the name
+        if not endpoints:
+            return None
+
+        return endpoints.get(self._normalize_model_name(model_name))
+
     def _get_underlying_provider(self, model_name: str) -> Optional[ModelProvider]:
         """Get the underlying provider for a model."""
-        if model_name in self._provider_cache:
-            return self._provider_cache[model_name]
-        
+        with self._provider_cache_lock:
+            if self._cache_generation != self._endpoints_generation:
+                self._provider_cache.clear()
+                self._cache_generation = self._endpoints_generation
+
+            entry = self._provider_cache.get(model_name)
+            if entry is not None:
+                provider, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._provider_cache.move_to_end(model_name)
+                    return provider
+                del self._provider_cache[model_name]
+
         endpoint_config = self._get_endpoint_for_model(model_name)
         if endpoint_config:
             try:
-                from .custom import CustomProvider
-                provider = CustomProvider(
-                    api_key=endpoint_config.get('api_key', ''),
-                    base_url=endpoint_config['base_url']
-                )
-                self._provider_cache[model_name] = provider
-                return provider
-            except ImportError:
-                logger.warning("CustomProvider not available, falling back to registry")
-        
+                provider = self._get_endpoint_provider(**endpoint_config)
+            except ValueError as e:
+                # Malformed endpoint (e.g. missing URL scheme): warn once and remember the miss
+                logger.warning("Invalid unified endpoint for model '%s': %s", model_name, e)
+                self._cache_provider(model_name, None)
+                return None
+            self._cache_provider(model_name, provider)
+            return provider
+
         provider = ModelProviderRegistry.get_provider_for_model(model_name)
-        if provider:
-            self._provider_cache[model_name] = provider
-        
+        self._cache_provider(model_name, provider)
+
         return provider
-    
+
+    def _cache_provider(self, model_name: str, provider: Optional[ModelProvider]) -> None:
+        """Remember the resolved provider for a model, evicting the least recently used entry.
+
+        A None provider is remembered as a miss for _MISS_TTL seconds.
+        """
+        expires_at = None if provider else time.monotonic() + _MISS_TTL
+        with self._provider_cache_lock:
+            # Resolved against endpoints that have since been reloaded
+            if self._cache_generation != self._endpoints_generation:
+                return
+            self._provider_cache[model_name] = (provider, expires_at)
+            if len(self._provider_cache) > _PROVIDER_CACHE_SIZE:
+                self._provider_cache.popitem(last=False)
+
+    @classmethod
+    def _get_endpoint_provider(cls, base_url: str, api_key: str) -> ModelProvider:
+        """Get or create the shared provider for a custom endpoint.
+
+        Args:
+            base_url: Base URL of the OpenAI-compatible endpoint
+            api_key: API key for the endpoint (may be empty)
+
+        Returns:
+            CustomProvider configured for the endpoint
+        """
+        key = (base_url, api_key)
+
+        # Check if provider already exists without locking for performance
+        if key in cls._endpoint_providers:
+            return cls._endpoint_providers[key]
+
+        with cls._endpoint_providers_lock:
+            # Double-check pattern: check again inside the lock
+            if key not in cls._endpoint_providers:
+                cls._endpoint_providers[key] = CustomProvider(api_key=api_key, base_url=base_url)
+
+        return cls._endpoint_providers[key]
+
     def generate_content(
         self,
         prompt: str,
@@ -95,69 +242,58 @@ class UnifiedOpenAIProvider(ModelProvider):
     ) -> ModelResponse:
         """Generate content by routing to the appropriate provider."""
         provider = self._get_underlying_provider(model_name)
-        
+
         if not provider:
             raise ValueError(f"No provider found for model: {model_name}")
-        
-        try:
-            from .openai_compatible import OpenAICompatibleProvider
-            if isinstance(provider, OpenAICompatibleProvider):
-                return provider.generate_content(
-                    prompt=prompt,
-                    model_name=model_name,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_output_tokens=max_output_tokens,
-                    **kwargs
-                )
-        except ImportError:
-            pass
-        
+
         response = provider.generate_content(
             prompt=prompt,
             model_name=model_name,
             system_prompt=system_prompt,
             temperature=temperature,
             max_output_tokens=max_output_tokens,
-            **kwargs
+            **kwargs,
         )
-        
-        if hasattr(response, 'friendly_name'):
+
+        # OpenAI-compatible providers keep their own friendly name on the response
+        if not isinstance(provider, OpenAICompatibleProvider) and hasattr(response, "friendly_name"):
             response.friendly_name = self.FRIENDLY_NAME
         return response
-    
+
     def get_capabilities(self, model_name: str) -> ModelCapabilities:
         """Get capabilities by delegating to the underlying provider."""
         provider = self._get_underlying_provider(model_name)
         if not provider:
             raise ValueError(f"No provider found for model: {model_name}")
-        
+
         return provider.get_capabilities(model_name)
-    
+
     def validate_model_name(self, model_name: str) -> bool:
         """Validate model by checking if any provider supports it."""
+        # A configured endpoint is enough; the provider for it is only built when first used
         if self._get_endpoint_for_model(model_name):
             return True
-        
-        provider = ModelProviderRegistry.get_provider_for_model(model_name)
-        return provider is not None
-    
+
+        # Resolve through the per-model cache so validation and the subsequent
+        # generate/capabilities calls share a single registry lookup
+        return self._get_underlying_provider(model_name) is not None
+
     def get_provider_type(self) -> ProviderType:
         """Return a unified provider type for the unified provider."""
         return ProviderType.UNIFIED
-    
+
     def supports_thinking_mode(self, model_name: str) -> bool:
         """Check thinking mode support by delegating to underlying provider."""
         provider = self._get_underlying_provider(model_name)
         if not provider:
             return False
-        
+
         return provider.supports_thinking_mode(model_name)
-    
+
     def count_tokens(self, text: str, model_name: str) -> int:
         """Count tokens by delegating to underlying provider."""
         provider = self._get_underlying_provider(model_name)
         if not provider:
             return len(text) // 4
-        
+
         return provider.count_tokens(text, model_name)
@@ -22,8 +22,10 @@ def test_unified_implementation():
         print("✓ Provider type:", provider.get_provider_type())
         
         print("\n3. Testing endpoint configuration...")
-        os.environ['TEST_MODEL_ENDPOINT'] = 'http://localhost:11434/v1'
-        os.environ['TEST_MODEL_API_KEY'] = 'test-key'
+        os.environ.update({
+            'TEST_MODEL_ENDPOINT': 'http://localhost:11434/v1',
+            'TEST_MODEL_API_KEY': 'test-key',
+        })
         
         provider2 = UnifiedOpenAIProvider()
         endpoint = provider2._get_endpoint_for_model('test-model')
@@ -57,6 +59,7 @@ def test_unified_implementation():
             json.dump(test_config, f)
         
         os.environ['UNIFIED_ENDPOINTS_CONFIG'] = config_path
+        UnifiedOpenAIProvider.reload_endpoints()
         provider3 = UnifiedOpenAIProvider()
         endpoint2 = provider3._get_endpoint_for_model('test-model-2')
         
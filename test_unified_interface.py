@@ -10,9 +10,11 @@ def test_unified_provider():
     try:
         from providers.unified_openai import UnifiedOpenAIProvider
         
-        os.environ['ENABLE_UNIFIED_OPENAI'] = 'true'
-        os.environ['TEST_MODEL_ENDPOINT'] = 'http://localhost:11434/v1'
-        os.environ['TEST_MODEL_API_KEY'] = 'test-key'
+        os.environ.update({
+            'ENABLE_UNIFIED_OPENAI': 'true',
+            'TEST_MODEL_ENDPOINT': 'http://localhost:11434/v1',
+            'TEST_MODEL_API_KEY': 'test-key',
+        })
         
         provider = UnifiedOpenAIProvider()
         
@@ -77,6 +77,11 @@ class TestOpenAIProvider:
         assert provider._resolve_model_name("o4-mini") == "o4-mini"
         assert provider._resolve_model_name("o4-mini") == "o4-mini"
 
+        # Test case-insensitive resolution and unknown passthrough
+        assert provider._resolve_model_name("MINI") == "o4-mini"
+        assert provider._resolve_model_name("GPT-4.1-2025-04-14") == "gpt-4.1-2025-04-14"
+        assert provider._resolve_model_name("unknown-model") == "unknown-model"
+
     def test_get_capabilities_o3(self):
         """Test getting model capabilities for O3."""
         provider = OpenAIModelProvider("test-key")
@@ -0,0 +1,310 @@
+"""Tests for the unified OpenAI-compatible provider."""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from providers import unified_openai
+from providers.base import ModelResponse, ProviderType
+from providers.registry import ModelProviderRegistry
+from providers.unified_openai import UnifiedOpenAIProvider
+
+
+@pytest.fixture(autouse=True)
+def reset_unified_state():
+    """Drop endpoint state and caches shared across instances before and after each test."""
+
+    def reset():
+        UnifiedOpenAIProvider.reload_endpoints()
+        UnifiedOpenAIProvider._endpoint_providers.clear()
+        unified_openai._load_json_config.cache_clear()
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture
+def endpoint_env(monkeypatch):
+    """Remove endpoint variables from the environment; tests set only the ones they need."""
+    for key in list(os.environ):
+        if key.endswith(("_ENDPOINT", "_API_KEY")) or key == "UNIFIED_ENDPOINTS_CONFIG":
+            monkeypatch.delenv(key)
+    return monkeypatch
+
+
+class TestUnifiedOpenAIProvider:
+    """Test unified provider endpoint loading and routing."""
+
+    def test_initialization(self, endpoint_env):
+        """Test provider initialization without any custom endpoints."""
+        provider = UnifiedOpenAIProvider()
+        assert provider.get_provider_type() == ProviderType.UNIFIED
+
+        with patch.object(UnifiedOpenAIProvider, "_normalize_model_name") as normalize:
+            assert provider._get_endpoint_for_model("llama3.2") is None
+        normalize.assert_not_called()
+
+    def test_endpoints_loaded_on_first_use(self, endpoint_env):
+        """Test endpoint configuration is loaded on first lookup and shared by instances."""
+        with patch.object(UnifiedOpenAIProvider, "_load_model_endpoints", return_value={}) as load:
+            provider = UnifiedOpenAIProvider()
+            load.assert_not_called()
+
+            provider._get_endpoint_for_model("llama3.2")
+            UnifiedOpenAIProvider()._get_endpoint_for_model("llama3.2")
+            load.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "env_prefix,api_key,model_name",
+        [
+            ("LOCAL_LLAMA", "test-key", "local-llama"),
+            # Lookups ignore case and separators
+            ("LOCAL_LLAMA", "test-key", "LOCAL-LLAMA"),
+            ("LOCAL_LLAMA", "test-key", "local_llama"),
+            ("LOCAL_LLAMA", "test-key", "localllama"),
+            # Model names containing dots
+            ("LLAMA3_2", "test-key", "llama3.2"),
+            # Endpoints without a matching API key default to an empty key
+            ("LOCAL_LLAMA", None, "local-llama"),
+        ],
+    )
+    def test_endpoint_from_environment(self, endpoint_env, env_prefix, api_key, model_name):
+        """Test <MODEL>_ENDPOINT / <MODEL>_API_KEY pairs are picked up."""
+        endpoint_env.setenv(f"{env_prefix}_ENDPOINT", "http://localhost:11434/v1")
+        if api_key is not None:
+            endpoint_env.setenv(f"{env_prefix}_API_KEY", api_key)
+
+        assert UnifiedOpenAIProvider()._get_endpoint_for_model(model_name) == {
+            "base_url": "http://localhost:11434/v1",
+            "api_key": api_key or "",
+        }
+
+    def test_endpoint_table_read_only(self, endpoint_env):
+        """Test neither the shared endpoint table nor its entries can be modified through an instance."""
+        endpoint_env.setenv("LOCAL_LLAMA_ENDPOINT", "http://localhost:11434/v1")
+        endpoints = UnifiedOpenAIProvider()._endpoints()
+
+        with pytest.raises(TypeError):
+            endpoints["other-model"] = {"base_url": "http://localhost:8080/v1", "api_key": ""}
+
+        endpoint = UnifiedOpenAIProvider()._get_endpoint_for_model("local-llama")
+        with pytest.raises(TypeError):
+            endpoint["base_url"] = "http://localhost:8080/v1"
+        assert endpoints["localllama"]["base_url"] == "http://localhost:11434/v1"
+
+    def test_endpoint_from_config_file(self, endpoint_env, tmp_path):
+        """Test endpoints can be loaded from UNIFIED_ENDPOINTS_CONFIG."""
+        config_path = tmp_path / "unified_endpoints.json"
+        config_path.write_text(
+            '{"model_endpoints": {"Test-Model": {"base_url": "http://localhost:8080/v1", "api_key": "file-key"}}}'
+        )
+        endpoint_env.setenv("UNIFIED_ENDPOINTS_CONFIG", str(config_path))
+        provider = UnifiedOpenAIProvider()
+
+        endpoint = provider._get_endpoint_for_model("test-model")
+        assert endpoint == {"base_url": "http://localhost:8080/v1", "api_key": "file-key"}
+        assert provider._get_endpoint_for_model("TEST-MODEL") == endpoint
+
+    def test_config_file_entries_normalized(self, endpoint_env, tmp_path):
+        """Test config file entries default api_key and skip entries without base_url."""
+        config_path = tmp_path / "unified_endpoints.json"
+        config_path.write_text(
+            '{"model_endpoints": {"llama3.2": {"base_url": "http://localhost:11434/v1"}, "broken": {"api_key": "x"}}}'
+        )
+        endpoint_env.setenv("UNIFIED_ENDPOINTS_CONFIG", str(config_path))
+        provider = UnifiedOpenAIProvider()
+
+        assert provider._get_endpoint_for_model("llama3.2") == {
+            "base_url": "http://localhost:11434/v1",
+            "api_key": "",
+        }
+        assert provider._get_endpoint_for_model("broken") is None
+
+    def test_config_file_malformed_entry_skipped(self, endpoint_env, tmp_path):
+        """Test an entry that is not an object is skipped without dropping the entries after it."""
+        config_path = tmp_path / "unified_endpoints.json"
+        config_path.write_text(
+            '{"model_endpoints": {"a-model": {"base_url": "http://localhost:8080/v1"}, '
+            '"b-model": "http://localhost:8081/v1", "c-model": {"base_url": "http://localhost:8082/v1"}}}'
+        )
+        endpoint_env.setenv("UNIFIED_ENDPOINTS_CONFIG", str(config_path))
+        provider = UnifiedOpenAIProvider()
+
+        assert provider._get_endpoint_for_model("a-model")["base_url"] == "http://localhost:8080/v1"
+        assert provider._get_endpoint_for_model("b-model") is None
+        assert provider._get_endpoint_for_model("c-model")["base_url"] == "http://localhost:8082/v1"
+
+    def test_colliding_endpoint_names_warn(self, endpoint_env, tmp_path):
+        """Test configured names that normalize to the same key are reported, last one winning."""
+        config_path = tmp_path / "unified_endpoints.json"
+        config_path.write_text(
+            '{"model_endpoints": {"gpt-4": {"base_url": "http://localhost:8080/v1"}, '
+            '"gpt_4": {"base_url": "http://localhost:9090/v1"}}}'
+        )
+        endpoint_env.setenv("UNIFIED_ENDPOINTS_CONFIG", str(config_path))
+
+        with patch("providers.unified_openai.logger") as logger:
+            endpoint = UnifiedOpenAIProvider()._get_endpoint_for_model("gpt-4")
+
+        assert endpoint["base_url"] == "http://localhost:9090/v1"
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[1:] == ("gpt_4", "gpt-4")
+
+    def test_config_file_reparsed_only_when_modified(self, endpoint_env, tmp_path):
+        """Test reloading re-parses the config file only after it changes."""
+        config_path = tmp_path / "unified_endpoints.json"
+        config_path.write_text('{"model_endpoints": {"test-model": {"base_url": "http://localhost:8080/v1"}}}')
+        os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+        endpoint_env.setenv("UNIFIED_ENDPOINTS_CONFIG", str(config_path))
+
+        with patch("providers.unified_openai.json.loads", wraps=json.loads) as parse:
+            UnifiedOpenAIProvider()._get_endpoint_for_model("test-model")
+            UnifiedOpenAIProvider.reload_endpoints()
+            UnifiedOpenAIProvider()._get_endpoint_for_model("test-model")
+            assert parse.call_count == 1
+
+            config_path.write_text('{"model_endpoints": {"test-model": {"base_url": "http://localhost:9090/v1"}}}')
+            os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+            UnifiedOpenAIProvider.reload_endpoints()
+
+            endpoint = UnifiedOpenAIProvider()._get_endpoint_for_model("test-model")
+            assert endpoint["base_url"] == "http://localhost:9090/v1"
+            assert parse.call_count == 2
+
+    def test_reload_endpoints(self, endpoint_env):
+        """Test reload_endpoints picks up configuration changes."""
+        assert UnifiedOpenAIProvider()._get_endpoint_for_model("local-llama") is None
+
+        endpoint_env.setenv("LOCAL_LLAMA_ENDPOINT", "http://localhost:11434/v1")
+        assert UnifiedOpenAIProvider()._get_endpoint_for_model("local-llama") is None
+
+        UnifiedOpenAIProvider.reload_endpoints()
+        assert UnifiedOpenAIProvider()._get_endpoint_for_model("local-llama") == {
+            "base_url": "http://localhost:11434/v1",
+            "api_key": "",
+        }
+
+    def test_reload_endpoints_drops_cached_miss(self, endpoint_env):
+        """Test a miss cached before reload_endpoints does not hide a newly configured endpoint."""
+        provider = UnifiedOpenAIProvider()
+
+        with patch.object(ModelProviderRegistry, "get_provider_for_model", return_value=None):
+            assert provider.validate_model_name("llama") is False
+
+            endpoint_env.setenv("LLAMA_ENDPOINT", "http://localhost:11434/v1")
+            UnifiedOpenAIProvider.reload_endpoints()
+
+            assert provider.validate_model_name("llama") is True
+            assert provider._get_underlying_provider("llama").base_url == "http://localhost:11434/v1"
+
+    def test_missing_config_file(self, endpoint_env):
+        """Test an unreadable config file is ignored rather than raising."""
+        endpoint_env.setenv("UNIFIED_ENDPOINTS_CONFIG", "/nonexistent/unified_endpoints.json")
+        provider = UnifiedOpenAIProvider()
+        assert provider._get_endpoint_for_model("test-model") is None
+
+    def test_validation_resolves_provider_once(self, endpoint_env):
+        """Test repeated validation reuses the cached underlying provider."""
+        provider = UnifiedOpenAIProvider()
+        underlying = MagicMock()
+
+        with patch.object(ModelProviderRegistry, "get_provider_for_model", return_value=underlying) as lookup:
+            assert provider.validate_model_name("gemini-2.5-flash") is True
+            assert provider.validate_model_name("gemini-2.5-flash") is True
+            provider.get_capabilities("gemini-2.5-flash")
+
+        lookup.assert_called_once_with("gemini-2.5-flash")
+        underlying.get_capabilities.assert_called_once_with("gemini-2.5-flash")
+
+    def test_endpoint_provider_shared(self, endpoint_env):
+        """Test models on the same endpoint share one provider across instances."""
+        endpoint_env.setenv("LLAMA_ENDPOINT", "http://localhost:11434/v1")
+        endpoint_env.setenv("QWEN_ENDPOINT", "http://localhost:11434/v1")
+        llama_provider = UnifiedOpenAIProvider()._get_underlying_provider("llama")
+        qwen_provider = UnifiedOpenAIProvider()._get_underlying_provider("qwen")
+
+        assert llama_provider is qwen_provider
+        assert llama_provider.base_url == "http://localhost:11434/v1"
+
+    def test_validation_does_not_build_endpoint_provider(self, endpoint_env):
+        """Test validating an endpoint model only checks the configuration."""
+        endpoint_env.setenv("LLAMA_ENDPOINT", "http://localhost:11434/v1")
+        provider = UnifiedOpenAIProvider()
+
+        with patch.object(UnifiedOpenAIProvider, "_get_endpoint_provider") as build:
+            assert provider.validate_model_name("llama") is True
+
+        build.assert_not_called()
+
+    def test_malformed_endpoint_url(self, endpoint_env):
+        """Test an endpoint URL without a scheme is reported once instead of raising."""
+        endpoint_env.setenv("MYMODEL_ENDPOINT", "localhost:11434/v1")
+        provider = UnifiedOpenAIProvider()
+
+        assert provider.validate_model_name("mymodel") is True
+        with patch("providers.unified_openai.logger") as logger:
+            assert provider._get_underlying_provider("mymodel") is None
+            assert provider._get_underlying_provider("mymodel") is None
+            assert provider.supports_thinking_mode("mymodel") is False
+
+        logger.warning.assert_called_once()
+        with pytest.raises(ValueError, match="No provider found"):
+            provider.generate_content("hello", "mymodel")
+
+    def test_unknown_model_lookup_cached(self, endpoint_env):
+        """Test models no provider supports are not looked up in the registry again."""
+        provider = UnifiedOpenAIProvider()
+
+        with patch.object(ModelProviderRegistry, "get_provider_for_model", return_value=None) as lookup:
+            assert provider.validate_model_name("unknown-model") is False
+            assert provider.validate_model_name("unknown-model") is False
+            assert provider.supports_thinking_mode("unknown-model") is False
+
+        lookup.assert_called_once_with("unknown-model")
+
+    def test_unknown_model_lookup_expires(self, endpoint_env):
+        """Test a cached miss is looked up again once it expires, picking up providers registered later."""
+        provider = UnifiedOpenAIProvider()
+        underlying = MagicMock()
+
+        with patch.object(ModelProviderRegistry, "get_provider_for_model", side_effect=[None, underlying]) as lookup:
+            with patch("providers.unified_openai.time.monotonic", return_value=1000.0):
+                assert provider.validate_model_name("new-model") is False
+                assert provider.validate_model_name("new-model") is False
+
+            with patch("providers.unified_openai.time.monotonic", return_value=1000.0 + unified_openai._MISS_TTL):
+                assert provider.validate_model_name("new-model") is True
+
+        assert lookup.call_count == 2
+
+    def test_generate_content_routes_to_provider(self, endpoint_env):
+        """Test generation is delegated to the underlying provider."""
+        provider = UnifiedOpenAIProvider()
+        underlying = MagicMock()
+        underlying.generate_content.return_value = ModelResponse(content="ok", friendly_name="Gemini")
+
+        with patch.object(ModelProviderRegistry, "get_provider_for_model", return_value=underlying):
+            response = provider.generate_content("hello", "gemini-2.5-flash", temperature=0.5)
+
+        underlying.generate_content.assert_called_once_with(
+            prompt="hello",
+            model_name="gemini-2.5-flash",
+            system_prompt=None,
+            temperature=0.5,
+            max_output_tokens=None,
+        )
+        assert response.content == "ok"
+        assert response.friendly_name == "Unified OpenAI"
+
+    def test_count_tokens_fallback(self, endpoint_env):
+        """Test token counting falls back to a character estimate for unroutable models."""
+        provider = UnifiedOpenAIProvider()
+
+        with patch.object(ModelProviderRegistry, "get_provider_for_model", return_value=None) as lookup:
+            assert provider.count_tokens("a" * 40, "unknown-model") == 10
+            assert provider.count_tokens("a" * 80, "unknown-model") == 20
+
+        lookup.assert_called_once_with("unknown-model")